@@ -485,7 +485,7 @@ from numpy import real, imag, conj, angle, radians, abs             # NOQA
 from numpy import arcsin, arccos, arctan, arctan2                   # NOQA
 from numpy import log                                               # NOQA
 
-from andes.thirdparty.npfunc import *                               # NOQA
+from andes.thirdparty.npfunc import safe_div                        # NOQA
 
 """
         # header goes first
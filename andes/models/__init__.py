@@ -44,4 +44,9 @@ file_classes = list([
 ])
 
 
+# flat mapping of model class name to its file name, built once at import
+cls_to_file = {model_name: fname
+               for fname, cls_list in file_classes
+               for model_name in cls_list}
+
 model_aliases = {"REGCVSG": "REGCV1", "REGCVSG2": "REGCV2", "Toggler": "Toggle"}
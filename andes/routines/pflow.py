@@ -60,6 +60,8 @@ class PFlow(BaseRoutine):
         self.x_sol = None
         self.y_sol = None
 
+        self._report = None
+
     def init(self):
         """
         Initialize variables for power flow.
@@ -82,6 +84,8 @@ class PFlow(BaseRoutine):
         self.x_sol = None
         self.y_sol = None
 
+        self._report = None
+
         self.system.set_var_arrays(self.models, inplace=True, alloc=False)
         self.system.init(self.models, routine='pflow')
 
@@ -278,8 +282,10 @@ class PFlow(BaseRoutine):
         """
 
         if self.system.files.no_output is False:
-            r = Report(self.system)
-            r.write()
+            # reuse the report so summaries are computed once per solution
+            if self._report is None:
+                self._report = Report(self.system)
+            self._report.write()
             return True
 
         return False
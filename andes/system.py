@@ -14,6 +14,7 @@ System class for power system data and methods
 import configparser
 import importlib
 import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 import inspect
 import logging
 import os
@@ -25,7 +26,7 @@ from typing import Dict, Optional, Tuple, Union
 import andes.io
 from andes.core import AntiWindup, Config, Model
 from andes.io.streaming import Streaming
-from andes.models import file_classes
+from andes.models import cls_to_file, file_classes
 from andes.models.group import GroupBase
 from andes.routines import all_routines
 from andes.shared import (NCPUS_PHYSICAL, Pool, Process, dilled_vars,
@@ -145,6 +146,7 @@ class System:
                                      ('numba', 0),
                                      ('numba_parallel', 0),
                                      ('numba_nopython', 1),
+                                     ('parallel_call', 0),
                                      ('yapf_pycode', 0),
                                      ('save_stats', 0),
                                      ('np_divide', 'warn'),
@@ -161,6 +163,7 @@ class System:
                               numba='use numba for JIT compilation',
                               numba_parallel='enable parallel for numba.jit',
                               numba_nopython='nopython mode for numba',
+                              parallel_call='dispatch model calls to a thread pool',
                               yapf_pycode='format generated code with yapf',
                               save_stats='store statistics of function calls',
                               np_divide='treatment for division by zero',
@@ -176,6 +179,7 @@ class System:
                               numba=(0, 1),
                               numba_parallel=(0, 1),
                               numba_nopython=(0, 1),
+                              parallel_call=(0, 1),
                               yapf_pycode=(0, 1),
                               save_stats=(0, 1),
                               np_divide={'ignore', 'warn', 'raise', 'call', 'print', 'log'},
@@ -205,6 +209,9 @@ class System:
         self.antiwindups = list()
         self.no_check_init = list()  # states for which initialization check is omitted
         self.call_stats = defaultdict(dict)  # call statistics storage
+        self._call_pool = None       # lazily created thread pool for `call_models`
+        self._z_models = None        # `get_z` cache of (models arg, models with discrete flags)
+        self._conn_pairs = None      # lazily built (fr, to) bus addresses for connectivity
 
         # internal flags
         self.is_setup = False        # if system has been setup
@@ -383,16 +390,19 @@ class System:
         if len(models) == 0:
             return
 
-        model_names = list(models.keys())
         model_list = list()
+        modules = dict()
 
-        for fname, cls_list in file_classes:
-            for model_name in cls_list:
-                if model_name not in model_names:
-                    continue
-                the_module = importlib.import_module('andes.models.' + fname)
-                the_class = getattr(the_module, model_name)
-                model_list.append(the_class(system=None, config=self._config_object))
+        # iterate the requested models only, using the flat `cls_to_file` map.
+        # The class name is taken from the instance so aliases resolve to
+        # their real model.
+        for mdl in models.values():
+            model_name = type(mdl).__name__
+            fname = cls_to_file[model_name]
+            if fname not in modules:
+                modules[fname] = importlib.import_module('andes.models.' + fname)
+            the_class = getattr(modules[fname], model_name)
+            model_list.append(the_class(system=None, config=self._config_object))
 
         yapf_pycode = self.config.yapf_pycode
 
@@ -507,9 +517,29 @@ class System:
         This will allow adding switches on the fly.
         """
 
-        self.exist.pflow = self.find_models('pflow')
-        self.exist.tds = self.find_models('tds')
-        self.exist.pflow_tds = self.find_models(('tds', 'pflow'))
+        pflow = OrderedDict()
+        tds = OrderedDict()
+        pflow_tds = OrderedDict()
+
+        # partition in one pass instead of calling `find_models` per flag
+        for name, mdl in self.models.items():
+            if (mdl.n == 0) or (mdl.in_use is False):
+                continue
+            if mdl.flags.pflow is True:
+                pflow[name] = mdl
+            if mdl.flags.tds is True:
+                tds[name] = mdl
+            if (mdl.flags.pflow is True) or (mdl.flags.tds is True):
+                pflow_tds[name] = mdl
+
+        self.exist.pflow = pflow
+        self.exist.tds = tds
+        self.exist.pflow_tds = pflow_tds
+
+        # invalidate the device-dependent caches used by `get_z` and
+        # `connectivity`
+        self._z_models = None
+        self._conn_pairs = None
 
     def reset(self, force=False):
         """
@@ -542,8 +572,8 @@ class System:
         if self.is_setup:
             raise NotImplementedError("Adding devices are not allowed after setup.")
 
-        group_name = self.__dict__[model].group
-        group = self.groups[group_name]
+        mdl = self.__dict__[model]
+        group = self.groups[mdl.group]
 
         if param_dict is None:
             param_dict = {}
@@ -558,11 +588,31 @@ class System:
             idx = None
 
         idx = group.get_next_idx(idx=idx, model_name=model)
-        self.__dict__[model].add(idx=idx, **param_dict)
-        group.add(idx=idx, model=self.__dict__[model])
+        mdl.add(idx=idx, **param_dict)
+        group.add(idx=idx, model=mdl)
 
         return idx
 
+    def _model_or_group(self, name):
+        """
+        Helper function for looking up a model or group instance by name.
+
+        Looking up the dedicated registries is faster than going through
+        the instance ``__dict__``, which holds every System attribute.
+
+        Raises
+        ------
+        KeyError if the name is not a model, model alias, or group name
+        """
+
+        if name in self.models:
+            return self.models[name]
+        if name in self.model_aliases:
+            return self.model_aliases[name]
+        if name in self.groups:
+            return self.groups[name]
+        raise KeyError(name)
+
     def find_devices(self):
         """
         Add dependent devices for all model based on `DeviceFinder`.
@@ -578,8 +628,14 @@ class System:
     def set_address(self, models):
         """
         Set addresses for differential and algebraic variables.
+
+        Array reallocation and name extension are skipped if every model
+        already has its addresses assigned.
         """
 
+        # True if any model has been assigned new addresses
+        changed = False
+
         # --- Phase 1: set internal variable addresses ---
         for mdl in models.values():
             if mdl.flags.address is True:
@@ -608,6 +664,8 @@ class System:
             for idx, item in enumerate(mdl.algebs.values()):
                 item.set_address(yaddr[idx], contiguous=not collate)
 
+            changed = True
+
         # --- Phase 2: set external variable addresses ---
         # NOTE:
         # This step will retrieve the number of variables (item.n) for Phase 3.
@@ -617,7 +675,7 @@ class System:
             for instance in mdl.cache.vars_ext.values():
                 ext_name = instance.model
                 try:
-                    ext_model = self.__dict__[ext_name]
+                    ext_model = self._model_or_group(ext_name)
                 except KeyError:
                     raise KeyError('<%s> is not a model or group name.' % ext_name)
 
@@ -649,6 +707,13 @@ class System:
                 self.dae.q += item.n
 
             mdl.flags.address = True
+            changed = True
+
+        # nothing new has been addressed; arrays and names are up to date
+        if changed is False:
+            logger.debug("set_address: no new addresses assigned. "
+                         "Skipped array reallocation.")
+            return
 
         # allocate memory for DAE arrays
         self.dae.resize_arrays()
@@ -809,7 +874,7 @@ class System:
             for instance in mdl.services_ext.values():
                 ext_name = instance.model
                 try:
-                    ext_model = self.__dict__[ext_name]
+                    ext_model = self._model_or_group(ext_name)
                 except KeyError:
                     raise KeyError('<%s> is not a model or group name.' % ext_name)
 
@@ -901,7 +966,7 @@ class System:
             # get external parameters with `link_external` and then calculate the pu coeff
             for instance in model.params_ext.values():
                 ext_name = instance.model
-                ext_model = self.__dict__[ext_name]
+                ext_model = self._model_or_group(ext_name)
 
                 try:
                     instance.link_external(ext_model)
@@ -970,9 +1035,12 @@ class System:
                       'g': Rb / Rn,
                       }
 
-            for prop, coeff in coeffs.items():
-                for p in mdl.find_param(prop).values():
-                    p.set_pu_coeff(coeff)
+            # one pass over parameters instead of one `find_param` scan
+            # per conversion property
+            for p in mdl.params.values():
+                for prop, enabled in p.property.items():
+                    if (enabled is True) and (prop in coeffs):
+                        p.set_pu_coeff(coeffs[prop])
 
             # store coeffs and bases back in models.
             mdl.coeffs = coeffs
@@ -1026,10 +1094,11 @@ class System:
         self.g_islands()
 
         # update variable values set by anti-windup limiters
+        dae_x = self.dae.x
         for item in self.antiwindups:
             if len(item.x_set) > 0:
                 for key, val, _ in item.x_set:
-                    np.put(self.dae.x, key, val)
+                    np.put(dae_x, key, val)
 
     def f_update(self, models: OrderedDict):
         """
@@ -1085,22 +1154,28 @@ class System:
 
         self.dae.restore_sparse()
         # collect sparse values into sparse structures
+        ipadd = self.config.ipadd
+
         for j_name in jac_names:
             j_size = self.dae.get_size(j_name)
+            j_mat = self.dae.__dict__[j_name]
 
             for mdl in models.values():
                 for rows, cols, vals in mdl.triplets.zip_ijv(j_name):
                     try:
-                        if self.config.ipadd:
-                            self.dae.__dict__[j_name].ipadd(vals, rows, cols)
+                        if ipadd:
+                            j_mat.ipadd(vals, rows, cols)
                         else:
-                            self.dae.__dict__[j_name] += spmatrix(vals, rows, cols, j_size, 'd')
+                            j_mat += spmatrix(vals, rows, cols, j_size, 'd')
                     except TypeError as e:
                         logger.error("Error adding Jacobian triplets to existing sparsity pattern.")
                         logger.error(f'{mdl.class_name}: j_name {j_name}, row={rows}, col={cols}, val={vals}, '
                                      f'j_size={j_size}')
                         raise e
 
+            # safety net in case `+=` ever rebinds the local
+            self.dae.__dict__[j_name] = j_mat
+
         self.j_islands()
 
         if info:
@@ -1216,32 +1291,36 @@ class System:
 
         n = self.Bus.n
 
-        # collect from-bus and to-bus indices
-        fr, to, u = list(), list(), list()
+        # collect from-bus and to-bus indices; the addresses are fixed after
+        # setup, so they are built once and reused across calls
+        if self._conn_pairs is None:
+            fr, to = list(), list()
+
+            # TODO: generalize it to all serial devices
+            # collect from Line
+            fr.extend(self.Line.a1.a.tolist())
+            to.extend(self.Line.a2.a.tolist())
 
-        # TODO: generalize it to all serial devices
-        # collect from Line
-        fr.extend(self.Line.a1.a.tolist())
-        to.extend(self.Line.a2.a.tolist())
-        u.extend(self.Line.u.v.tolist())
+            # collect from Jumper
+            fr.extend(self.Jumper.a1.a.tolist())
+            to.extend(self.Jumper.a2.a.tolist())
 
-        # collect from Jumper
-        fr.extend(self.Jumper.a1.a.tolist())
-        to.extend(self.Jumper.a2.a.tolist())
-        u.extend(self.Jumper.u.v.tolist())
+            # collect from Fortescue
+            for dest in (self.Fortescue.aa, self.Fortescue.ab, self.Fortescue.ac):
+                fr.extend(self.Fortescue.a.a.tolist())
+                to.extend(dest.a.tolist())
 
-        # collect from Fortescue
-        fr.extend(self.Fortescue.a.a.tolist())
-        to.extend(self.Fortescue.aa.a.tolist())
-        u.extend(self.Fortescue.u.v.tolist())
+            self._conn_pairs = (fr, to)
 
-        fr.extend(self.Fortescue.a.a.tolist())
-        to.extend(self.Fortescue.ab.a.tolist())
-        u.extend(self.Fortescue.u.v.tolist())
+        fr, to = self._conn_pairs
 
-        fr.extend(self.Fortescue.a.a.tolist())
-        to.extend(self.Fortescue.ac.a.tolist())
-        u.extend(self.Fortescue.u.v.tolist())
+        # connection statuses can change between calls and are re-collected
+        u = np.concatenate((self.Line.u.v,
+                            self.Jumper.u.v,
+                            self.Fortescue.u.v,
+                            self.Fortescue.u.v,
+                            self.Fortescue.u.v,
+                            )).tolist()
 
         os = [0] * len(u)
 
@@ -1266,13 +1345,16 @@ class System:
         temp = sparse(temp)  # need to drop allocated zero values
 
         # Translated find_islanded_areas from goderya.jl into Python
-        conn = spmatrix([], [], [], (1, n), 'd')
         island_sets = []
         starting_bus = 0
         visit_idx = 0
 
+        # set-based lookups avoid linear scans in the visit loop below
+        islanded = set(self.Bus.islanded_buses)
+        visited = set()
+
         while True:
-            if starting_bus in self.Bus.islanded_buses:
+            if starting_bus in islanded:
                 starting_bus += 1
                 continue
 
@@ -1288,15 +1370,15 @@ class System:
                 nelm = new_nelm
 
             island_sets.append(list(cons.J))
-            conn += cons
+            visited.update(cons.J)
 
-            if len(conn.J) >= (n - len(self.Bus.islanded_buses)):
+            if len(visited) >= (n - len(islanded)):
                 break
 
-            # Increment `starting_bus` until it's not in `conn.J` and
-            # `self.Bus.islanded_buses`
+            # Increment `starting_bus` until it has not been visited and
+            # is not islanded
             for i in range(visit_idx, self.Bus.n):
-                if i in conn.J or i in self.Bus.islanded_buses:
+                if i in visited or i in islanded:
                     i += 1
                 else:
                     visit_idx = i
@@ -1308,17 +1390,21 @@ class System:
 
         # --- check if all areas have a slack generator ---
         if len(self.Bus.island_sets) > 0:
+            # map each bus uid to its island number; -1 for islanded buses
+            island_of_bus = np.full(n, -1, dtype=int)
             for idx, island in enumerate(self.Bus.island_sets):
-                nosw = 1
-                slack_bus_uid = self.Bus.idx2uid(self.Slack.bus.v)
-                slack_u = self.Slack.u.v
-                for u, item in zip(slack_u, slack_bus_uid):
-                    if (u == 1) and (item in island):
-                        nosw -= 1
-                if nosw == 1:
-                    self.Bus.nosw_island.append(idx)
-                elif nosw < 0:
-                    self.Bus.msw_island.append(idx)
+                island_of_bus[island] = idx
+
+            slack_bus_uid = np.array(self.Bus.idx2uid(self.Slack.bus.v), dtype=int)
+            slack_u = np.array(self.Slack.u.v)
+            slack_islands = island_of_bus[slack_bus_uid[slack_u == 1]]
+
+            # number of online slack generators per island
+            nsw = np.bincount(slack_islands[slack_islands >= 0],
+                              minlength=len(self.Bus.island_sets))
+
+            self.Bus.nosw_island = np.where(nsw == 0)[0].tolist()
+            self.Bus.msw_island = np.where(nsw > 1)[0].tolist()
 
         # --- Post processing ---
         # 1. extend islanded buses, each in a list
@@ -1425,16 +1511,18 @@ class System:
         if model.flags.initialized is False:
             return
 
+        dae_arr = self.dae.__dict__[v_code]
+
         for var in model.cache.v_adders.values():
             if var.v_code != v_code:
                 continue
-            np.add.at(self.dae.__dict__[v_code], var.a, var.v)
+            np.add.at(dae_arr, var.a, var.v)
 
         for var in self._setters[v_code]:
             if var.owner.flags.initialized is False:
                 continue
             if var.n > 0:
-                np.put(self.dae.__dict__[v_code], var.a, var.v)
+                np.put(dae_arr, var.a, var.v)
 
     def _e_to_dae(self, eq_name: Union[str, Tuple] = ('f', 'g')):
         """
@@ -1449,10 +1537,11 @@ class System:
             eq_name = [eq_name]
 
         for name in eq_name:
+            dae_arr = self.dae.__dict__[name]
             for var in self._adders[name]:
-                np.add.at(self.dae.__dict__[name], var.a, var.e)
+                np.add.at(dae_arr, var.a, var.e)
             for var in self._setters[name]:
-                np.put(self.dae.__dict__[name], var.a, var.e)
+                np.put(dae_arr, var.a, var.e)
 
     def get_z(self, models: OrderedDict):
         """
@@ -1469,10 +1558,17 @@ class System:
         if len(self.dae.z) != self.dae.o:
             self.dae.z = np.zeros(self.dae.o, dtype=float)
 
+        # cache models contributing discrete flags; the membership is stable
+        # after setup, so the emptiness checks are not repeated every step.
+        # The cache is keyed on the passed dict so a different partition
+        # triggers a rebuild.
+        if (self._z_models is None) or (self._z_models[0] is not models):
+            z_models = [mdl for mdl in models.values()
+                        if (mdl.n > 0) and (len(mdl._input_z) > 0)]
+            self._z_models = (models, z_models)
+
         ii = 0
-        for mdl in models.values():
-            if mdl.n == 0 or len(mdl._input_z) == 0:
-                continue
+        for mdl in self._z_models[1]:
             for zz in mdl._input_z.values():
                 self.dae.z[ii:ii + mdl.n] = zz
                 ii += mdl.n
@@ -1689,12 +1785,31 @@ class System:
         -------
         The return value of the models in an OrderedDict
 
+        Notes
+        -----
+        When config option ``parallel_call`` is set, the calls are dispatched
+        to a thread pool so that models are evaluated concurrently. This is
+        opt-in because it assumes the called method only writes to
+        model-local arrays, which holds for the equation update methods but
+        is not guaranteed for arbitrary methods.
         """
         ret = OrderedDict()
-        for name, mdl in models.items():
-            ret[name] = getattr(mdl, method)(*args, **kwargs)
 
-            if self.config.save_stats:
+        if self.config.parallel_call and (len(models) > 1):
+            if self._call_pool is None:
+                self._call_pool = ThreadPoolExecutor(max_workers=NCPUS_PHYSICAL)
+
+            futures = OrderedDict()
+            for name, mdl in models.items():
+                futures[name] = self._call_pool.submit(getattr(mdl, method), *args, **kwargs)
+            for name, future in futures.items():
+                ret[name] = future.result()
+        else:
+            for name, mdl in models.items():
+                ret[name] = getattr(mdl, method)(*args, **kwargs)
+
+        if self.config.save_stats:
+            for name in models:
                 if method not in self.call_stats[name]:
                     self.call_stats[name][method] = 1
                 else:
@@ -1755,7 +1870,7 @@ class System:
             for idxp in model.idx_params.values():
                 if (idxp.model not in self.models) and (idxp.model not in self.groups):
                     continue
-                dest = self.__dict__[idxp.model]
+                dest = self._model_or_group(idxp.model)
 
                 if dest.n == 0:
                     continue
@@ -1795,8 +1910,9 @@ class System:
                 # skip other imported classes such as `OrderedDict`
                 continue
 
-            self.__dict__[name] = cls()
-            self.groups[name] = self.__dict__[name]
+            grp = cls()
+            self.__dict__[name] = grp
+            self.groups[name] = grp
 
     def import_models(self):
         """
@@ -1815,19 +1931,20 @@ class System:
         ``system.models['Bus']`` points the same instance as ``system.Bus``.
         """
         for fname, cls_list in file_classes:
+            the_module = importlib.import_module('andes.models.' + fname)
             for model_name in cls_list:
-                the_module = importlib.import_module('andes.models.' + fname)
                 the_class = getattr(the_module, model_name)
-                self.__dict__[model_name] = the_class(system=self, config=self._config_object)
-                self.models[model_name] = self.__dict__[model_name]
-                self.models[model_name].config.check()
+                mdl = the_class(system=self, config=self._config_object)
+                self.__dict__[model_name] = mdl
+                self.models[model_name] = mdl
+                mdl.config.check()
 
                 # link to the group
-                group_name = self.__dict__[model_name].group
-                self.__dict__[group_name].add_model(model_name, self.__dict__[model_name])
+                self.__dict__[mdl.group].add_model(model_name, mdl)
         for key, val in andes.models.model_aliases.items():
-            self.model_aliases[key] = self.models[val]
-            self.__dict__[key] = self.models[val]
+            mdl = self.models[val]
+            self.model_aliases[key] = mdl
+            self.__dict__[key] = mdl
 
     def import_routines(self):
         """
@@ -1842,13 +1959,14 @@ class System:
         time-domain analysis and eigenvalue analysis routines, respectively.
         """
         for file, cls_list in all_routines.items():
+            the_module = importlib.import_module('andes.routines.' + file)
             for cls_name in cls_list:
-                file = importlib.import_module('andes.routines.' + file)
-                the_class = getattr(file, cls_name)
+                the_class = getattr(the_module, cls_name)
                 attr_name = cls_name
-                self.__dict__[attr_name] = the_class(system=self, config=self._config_object)
-                self.routines[attr_name] = self.__dict__[attr_name]
-                self.routines[attr_name].config.check()
+                rtn = the_class(system=self, config=self._config_object)
+                self.__dict__[attr_name] = rtn
+                self.routines[attr_name] = rtn
+                rtn.config.check()
 
     def store_switch_times(self, models, eps=1e-4):
         """
@@ -1938,11 +2056,17 @@ class System:
 
     def remove_pycapsule(self):
         """
-        Remove PyCapsule objects in solvers.
+        Remove PyCapsule objects in solvers and other unpicklable state.
         """
         for r in self.routines.values():
             r.solver.clear()
 
+        # the thread pool for `call_models` cannot be pickled; it will be
+        # recreated on demand
+        if self._call_pool is not None:
+            self._call_pool.shutdown()
+            self._call_pool = None
+
     def _store_calls(self, models: OrderedDict):
         """
         Collect and store model calls into system.
@@ -2143,8 +2267,10 @@ class System:
                     uid = mdl_instance.idx2uid(dev)
                     export_vars[item.v_code].append(item.a[uid])
 
-        self.Output.xidx = sorted(np.unique(export_vars['x']))
-        self.Output.yidx = sorted(np.unique(export_vars['y']))
+        # `np.unique` already returns sorted arrays; keeping them as arrays
+        # avoids a list-to-array conversion at every stored time step
+        self.Output.xidx = np.unique(export_vars['x']).astype(int)
+        self.Output.yidx = np.unique(export_vars['y']).astype(int)
 
 
 # --------------- Helper Functions ---------------
@@ -2300,10 +2426,17 @@ def _set_xy_name(mdl, vars_dict, dests):
 
     mdl_name = mdl.class_name
     idx = mdl.idx
+    names, tex_names = dests
+
+    # build the "<model> <idx>" suffix once per device instead of
+    # twice per variable and device
+    suffixes = [_append_model_name(mdl_name, idx_item) for idx_item in idx.v]
+
     for name, item in vars_dict.items():
-        for idx_item, addr in zip(idx.v, item.a):
-            dests[0][addr] = f'{name} {_append_model_name(mdl_name, idx_item)}'
-            dests[1][addr] = rf'${item.tex_name}$ {_append_model_name(mdl_name, idx_item)}'
+        tex_name = item.tex_name
+        for suffix, addr in zip(suffixes, item.a):
+            names[addr] = f'{name} {suffix}'
+            tex_names[addr] = rf'${tex_name}$ {suffix}'
 
 
 def _set_hi_name(mdl, vars_dict, dests):
@@ -2313,15 +2446,20 @@ def _set_hi_name(mdl, vars_dict, dests):
 
     mdl_name = mdl.class_name
     idx = mdl.idx
+    names, tex_names = dests
+
     for item in vars_dict.values():
         if len(item.r) != len(idx.v):
             idxall = item.indexer.v
         else:
             idxall = idx.v
 
+        ename = item.ename
+        tex_ename = item.tex_ename
         for idx_item, addr in zip(idxall, item.r):
-            dests[0][addr] = f'{item.ename} {_append_model_name(mdl_name, idx_item)}'
-            dests[1][addr] = rf'${item.tex_ename}$ {_append_model_name(mdl_name, idx_item)}'
+            suffix = _append_model_name(mdl_name, idx_item)
+            names[addr] = f'{ename} {suffix}'
+            tex_names[addr] = rf'${tex_ename}$ {suffix}'
 
 
 def _set_z_name(mdl, dae, dests):
@@ -2329,15 +2467,19 @@ def _set_z_name(mdl, dae, dests):
     Helper function for addng and setting discrete flag names.
     """
 
+    if mdl.flags.initialized:
+        return
+
+    mdl_name = mdl.class_name
+    names, tex_names = dests
+    suffixes = [_append_model_name(mdl_name, idx_item) for idx_item in mdl.idx.v]
+
     for item in mdl.discrete.values():
-        if mdl.flags.initialized:
-            continue
-        mdl_name = mdl.class_name
-
-        for name, tex_name in zip(item.get_names(), item.get_tex_names()):
-            for idx_item in mdl.idx.v:
-                dests[0].append(f'{name} {_append_model_name(mdl_name, idx_item)}')
-                dests[1].append(rf'${item.tex_name}$ {_append_model_name(mdl_name, idx_item)}')
+        tex_name = item.tex_name
+        for name in item.get_names():
+            for suffix in suffixes:
+                names.append(f'{name} {suffix}')
+                tex_names.append(rf'${tex_name}$ {suffix}')
                 dae.o += 1
 
 
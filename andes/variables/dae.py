@@ -49,16 +49,13 @@ class DAETimeSeries:
             """
             Helper function to convert data stord in a dict to an array.
             """
-            if len(self.__dict__[src]):
-                nx = len(self.__dict__[src][self.t[0]])
-            else:
-                nx = 0
-
-            self.__dict__[dest] = np.zeros((n_steps, nx))
+            src_dict = self.__dict__[src]
 
-            if len(self.__dict__[src]) > 0:
-                for ii, val in enumerate(self.__dict__[src].values()):
-                    self.__dict__[dest][ii, :] = val
+            if len(src_dict) > 0:
+                # bulk conversion builds the matrix in one pass in C
+                self.__dict__[dest] = np.array(list(src_dict.values()))
+            else:
+                self.__dict__[dest] = np.zeros((n_steps, 0))
 
         pairs = (('_xs', 'x'), ('_ys', 'y'), ('_zs', 'z'),
                  ('_fs', 'f'), ('_hs', 'h'), ('_is', 'i'))
@@ -34,6 +34,7 @@ class Report:
         self.system = system
         self.basic = OrderedDict()
         self.extended = OrderedDict()
+        self._updated = False    # True if summaries are current for the solution
 
     @property
     def info(self):
@@ -41,13 +42,19 @@ class Report:
 
     def update(self):
         """
-        Update values based on the requested content
+        Update values based on the requested content.
+
+        The summaries are computed once per power flow solution and reused
+        by subsequent calls until invalidated.
         """
+        if self._updated is True:
+            return
+
         system = self.system
         self.basic.update({
             'Buses': system.Bus.n,
             'Generators': system.PV.n + system.Slack.n,
-            'Committed Gens': int(sum(system.PV.u.v) + sum(system.Slack.u.v)),
+            'Committed Gens': int(np.sum(system.PV.u.v) + np.sum(system.Slack.u.v)),
             'Loads': system.PQ.n,
             'Shunts': system.Shunt.n,
             'Lines': system.Line.n,
@@ -60,18 +67,20 @@ class Report:
             return
 
         self.extended.update({
-            'Pg': sum(system.PV.u.v * system.PV.p.v) + sum(system.Slack.u.v * system.Slack.p.v),
-            'Qg': sum(system.PV.u.v * system.PV.q.v) + sum(system.Slack.u.v * system.Slack.q.v),
-            'Pl': round(float(sum(system.PQ.p0.v)), 6),
-            'Ql': round(float(sum(system.PQ.q0.v)), 6),
-            'Ptot': sum(system.PV.pmax.v) + sum(system.Slack.pmax.v),
-            'Pon': sum(system.PV.u.v * system.PV.pmax.v),
-            'Qtot_min': sum(system.PV.qmin.v) + sum(system.Slack.qmin.v),
-            'Qtot_max': sum(system.PV.qmax.v) + sum(system.Slack.qmax.v),
-            'Qon_min': sum(system.PV.u.v * system.PV.qmin.v),
-            'Qon_max': sum(system.PV.u.v * system.PV.qmax.v),
+            'Pg': np.sum(system.PV.u.v * system.PV.p.v) + np.sum(system.Slack.u.v * system.Slack.p.v),
+            'Qg': np.sum(system.PV.u.v * system.PV.q.v) + np.sum(system.Slack.u.v * system.Slack.q.v),
+            'Pl': round(float(np.sum(system.PQ.p0.v)), 6),
+            'Ql': round(float(np.sum(system.PQ.q0.v)), 6),
+            'Ptot': np.sum(system.PV.pmax.v) + np.sum(system.Slack.pmax.v),
+            'Pon': np.sum(system.PV.u.v * system.PV.pmax.v),
+            'Qtot_min': np.sum(system.PV.qmin.v) + np.sum(system.Slack.qmin.v),
+            'Qtot_max': np.sum(system.PV.qmax.v) + np.sum(system.Slack.qmax.v),
+            'Qon_min': np.sum(system.PV.u.v * system.PV.qmin.v),
+            'Qon_max': np.sum(system.PV.u.v * system.PV.qmax.v),
         })
 
+        self._updated = True
+
     def write(self):
         """
         Write report to file.
@@ -167,14 +176,14 @@ class Report:
             text.append(['OTHER ALGEBRAIC VARIABLES:\n'])
             header.append([''])
             row_name.append(system.dae.y_name[2 * system.Bus.n:system.dae.m])
-            data.append([round(i, 6) for i in system.dae.y[2 * system.Bus.n:]])
+            data.append(np.round(system.dae.y[2 * system.Bus.n:], 6))
 
             # Additional State variable data
             if system.dae.n:
                 text.append(['OTHER STATE VARIABLES:\n'])
                 header.append([''])
                 row_name.append(system.dae.x_name[:])
-                data.append([round(i, 6) for i in system.dae.x[:]])
+                data.append(np.round(system.dae.x[:], 6))
 
         dump_data(text, header, row_name, data, system.files.txt)
 
@@ -4,6 +4,8 @@ Tests for configurations.
 
 import unittest
 
+import numpy as np
+
 import andes
 
 
@@ -31,3 +33,21 @@ class TestConfigOption(unittest.TestCase):
         ss = andes.load(path, config_option=["PQ.pq2z=0", "TDS.tf = 1"], default_config=True)
         self.assertEqual(ss.PQ.config.pq2z, 0)
         self.assertEqual(ss.TDS.config.tf, 1)
+
+    def test_parallel_call(self):
+        """
+        Test that `System.parallel_call = 1` gives the same solution as the
+        serial path.
+        """
+
+        path = andes.get_case("kundur/kundur_full.xlsx")
+
+        ss_serial = andes.run(path, routine='tds', tf=0.5,
+                              no_output=True, default_config=True)
+        ss_parallel = andes.run(path, routine='tds', tf=0.5,
+                                config_option=["System.parallel_call=1"],
+                                no_output=True, default_config=True)
+
+        self.assertEqual(ss_parallel.config.parallel_call, 1)
+        np.testing.assert_allclose(ss_parallel.dae.x, ss_serial.dae.x)
+        np.testing.assert_allclose(ss_parallel.dae.y, ss_serial.dae.y)